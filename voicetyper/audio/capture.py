@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import math
 import queue
 import threading
+import time
+from collections import deque
 from typing import Callable, Iterable
 
 import numpy as np
@@ -9,26 +12,43 @@ import sounddevice as sd
 
 
 class AudioLevelMeter:
+    # Stop computing RMS when nobody has called level() for this long; the
+    # controller's meter is never polled, the mic-selection UI polls at 10 Hz.
+    _READ_IDLE_SECONDS = 0.2
+
     def __init__(self):
         self._lock = threading.Lock()
         self._rms = 0.0
+        self._scratch: np.ndarray | None = None
+        self._last_read = 0.0
 
-    def update(self, data: bytes):
-        # Convert to numpy for RMS calculation
+    def update(self, data):
+        """data: any buffer of PCM16LE samples (bytes, memoryview, cffi buffer)."""
+        # Demand-driven: skip the reduction entirely while the meter is unread.
+        if time.monotonic() - self._last_read > self._READ_IDLE_SECONDS:
+            return
         if not data:
             return
+        # frombuffer views the caller's buffer directly; no copy.
         audio = np.frombuffer(data, dtype=np.int16)
         if audio.size == 0:
             return
-        with np.errstate(all="ignore"):
-            rms_val = np.sqrt(np.mean(np.square(audio)))
-        if not np.isfinite(rms_val):
+        # Persistent float32 scratch; the slice assignment casts in place so
+        # steady-state updates allocate nothing.
+        if self._scratch is None or self._scratch.size != audio.size:
+            self._scratch = np.empty(audio.size, dtype=np.float32)
+        samples = self._scratch
+        samples[:] = audio
+        # Single fused dot-product pass; avoids the square+mean temporaries.
+        rms_val = math.sqrt(float(np.dot(samples, samples)) / samples.size)
+        if not math.isfinite(rms_val):
             return
-        rms = float(rms_val) / 32768.0
+        rms = rms_val / 32768.0
         with self._lock:
             self._rms = rms
 
     def level(self) -> float:
+        self._last_read = time.monotonic()
         with self._lock:
             return self._rms
 
@@ -36,26 +56,39 @@ class AudioLevelMeter:
 class QueueAudioStream:
     """
     File-like wrapper that Speechmatics client can read from.
+
+    Single-producer (capture loop) / single-consumer (websocket reader), so a
+    GIL-atomic deque plus one wakeup Event replaces queue.Queue's two-lock
+    put/get path.
     """
 
     def __init__(self):
-        self._queue: queue.Queue[bytes | None] = queue.Queue()
+        self._chunks: deque[bytes] = deque()
+        self._ready = threading.Event()
         self.closed = False
 
     def push(self, data: bytes):
         if self.closed:
             return
-        self._queue.put(data)
+        self._chunks.append(data)
+        self._ready.set()
 
     def close(self):
         self.closed = True
-        self._queue.put(None)
+        self._ready.set()
 
     def read(self, _size: int | None = None) -> bytes:
-        chunk = self._queue.get()
-        if chunk is None:
-            return b""
-        return chunk
+        while True:
+            try:
+                return self._chunks.popleft()
+            except IndexError:
+                if self.closed:
+                    return b""
+                self._ready.clear()
+                # Re-check after clearing so a push racing the clear is not lost.
+                if self._chunks or self.closed:
+                    continue
+                self._ready.wait()
 
 
 class MicrophoneStream:
@@ -89,15 +122,26 @@ class MicrophoneStream:
 
         frame_count = int(self.sample_rate * self.chunk_ms / 1000)
 
+        # Bind hot references once; the callback runs on the PortAudio thread
+        # every chunk and should not pay attribute chains there.
+        stop_is_set = self._stop_event.is_set
+        put = self._queue.put
+        meter = self.level_meter
+
         def callback(indata, frames, _time, status):
             if status:
                 # Non-fatal; drop if needed
                 pass
-            data_bytes = bytes(indata)
-            if self.level_meter:
-                self.level_meter.update(data_bytes)
-            if not self._stop_event.is_set():
-                self._queue.put(data_bytes)
+            if stop_is_set():
+                return
+            if meter:
+                # The meter reads PortAudio's buffer in place; it finishes
+                # within this callback, so no copy is needed for it.
+                meter.update(indata)
+            # One copy out of PortAudio's reused buffer for the queue;
+            # consumers (backend queue, VAD) retain frames past the callback,
+            # so this copy cannot be pooled away.
+            put(bytes(indata))
 
         self._stream = sd.RawInputStream(
             samplerate=self.sample_rate,
@@ -105,6 +149,7 @@ class MicrophoneStream:
             device=self.device_index,
             dtype="int16",
             channels=self.channels,
+            latency="low",
             callback=callback,
         )
         self._stream.start()
@@ -115,12 +160,29 @@ class MicrophoneStream:
             self._stream.stop()
             self._stream.close()
             self._stream = None
-        # Drain queue
-        while not self._queue.empty():
-            try:
-                self._queue.get_nowait()
-            except queue.Empty:
-                break
+        # Drain queue: clear the underlying deque in one O(1) call instead of
+        # popping entries one at a time.
+        try:
+            with self._queue.mutex:
+                self._queue.queue.clear()
+                self._queue.unfinished_tasks = 0
+                self._queue.not_full.notify_all()
+        except AttributeError:
+            # Fallback if Queue internals ever change.
+            while not self._queue.empty():
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+    def poke(self):
+        """
+        Wake a consumer blocked in frames() with an empty sentinel frame.
+
+        Lets event sources (e.g. keyword force-end) interrupt the capture loop
+        immediately instead of waiting for the next audio chunk.
+        """
+        self._queue.put(b"")
 
     def frames(self) -> Iterable[bytes]:
         """
@@ -2,10 +2,18 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    # Optional speedup for config load/save; stdlib json remains the fallback.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class KeywordAction:
@@ -40,14 +48,10 @@ def parse_keyword_actions(raw: object) -> list[KeywordAction]:
             return actions
 
         # Mapping of word -> options
-        candidates: list[dict] = []
-        for word, cfg in raw.items():
-            if isinstance(cfg, dict):
-                item = cfg.copy()
-                item["word"] = word
-            else:
-                item = {"word": word}
-            candidates.append(item)
+        candidates: list[dict] = [
+            {**cfg, "word": word} if isinstance(cfg, dict) else {"word": word}
+            for word, cfg in raw.items()
+        ]
     elif isinstance(raw, list):
         candidates = [item for item in raw if isinstance(item, dict)]
     else:
@@ -55,24 +59,38 @@ def parse_keyword_actions(raw: object) -> list[KeywordAction]:
 
     for item in candidates:
         word = str(item.get("word") or "").strip()
-        if not word:
+        # Stop keyword is deprecated/disabled.
+        if not word or word.lower() == "stop":
             continue
         keys_raw = item.get("keys", [])
         if isinstance(keys_raw, str):
             keys = [keys_raw]
         elif isinstance(keys_raw, list):
-            keys = [str(k) for k in keys_raw if str(k).strip()]
+            keys = [k for k in map(str, keys_raw) if k.strip()]
         else:
             keys = []
         force_end_raw = item.get("force_end")
         force_end = True if force_end_raw is None else bool(force_end_raw)
         actions.append(KeywordAction(word=word, keys=keys, force_end=force_end))
 
-    # Stop keyword is deprecated/disabled.
-    actions = [a for a in actions if a.word.strip().lower() != "stop"]
     return actions
 
 
+def compile_keyword_pattern(actions: list[KeywordAction]) -> re.Pattern[str] | None:
+    """
+    Build one alternation regex that finds any keyword in a single text pass.
+
+    Words are lowercased, so the pattern should be matched against lowercased
+    text; group 1 captures the keyword for mapping back to its KeywordAction.
+    Returns None when no keywords are configured.
+    """
+    words = [a.word.strip().lower() for a in actions if a.word.strip()]
+    if not words:
+        return None
+    alternation = "|".join(re.escape(w) for w in words)
+    return re.compile(rf"\b({alternation})\b[^\w\s]*")
+
+
 @dataclass
 class AppConfig:
     api_key: str | None = None
@@ -161,6 +179,87 @@ def create_default_config_file(path: Path) -> None:
         print(f"Warning: Could not create config file: {e}", file=sys.stderr)
 
 
+@lru_cache(maxsize=4)
+def _load_config_file(path_str: str, _mtime: float) -> AppConfig:
+    """
+    Parse and merge the config file; cached per (path, mtime) so repeated
+    load_config() calls skip disk IO and JSON parsing until the file changes.
+    """
+    # Start with defaults
+    config = AppConfig()
+
+    try:
+        raw = Path(path_str).read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        # Notifications
+        if "notifications" in data:
+            config.notifications_enabled = data["notifications"].get("enabled", False)
+
+        # Hotkey
+        if "hotkey" in data:
+            config.hotkey_toggle_listening = data["hotkey"].get("toggle_listening")
+
+        # API settings
+        if "api" in data:
+            api = data["api"]
+            if api.get("key"):
+                config.api_key = api["key"]
+                if "validated" not in api:
+                    config.api_key_validated = True
+            if "validated" in api:
+                config.api_key_validated = bool(api["validated"])
+            if api.get("connection_url"):
+                config.connection_url = api["connection_url"]
+
+        # Audio settings
+        if "audio" in data:
+            audio = data["audio"]
+            if "sample_rate" in audio:
+                config.sample_rate = audio["sample_rate"]
+            if "silence_timeout" in audio:
+                config.silence_timeout = audio["silence_timeout"]
+            if "min_stream_seconds" in audio:
+                config.min_stream_seconds = audio["min_stream_seconds"]
+
+        # Transcription settings
+        if "transcription" in data:
+            trans = data["transcription"]
+            if "language" in trans:
+                config.language = trans["language"]
+            if "prefer_partials" in trans:
+                config.prefer_partials = trans["prefer_partials"]
+            if "max_delay" in trans:
+                config.max_delay = trans["max_delay"]
+            if "ws_idle_timeout" in trans:
+                config.ws_idle_timeout = trans["ws_idle_timeout"]
+
+        # Keywords
+        if "keywords" in data:
+            parsed_keywords = parse_keyword_actions(data["keywords"])
+            if parsed_keywords:
+                config.keyword_actions = parsed_keywords
+
+        # Debug
+        if "debug" in data:
+            debug = data["debug"]
+            if "enabled" in debug:
+                config.debug = debug["enabled"]
+            if "log_path" in debug:
+                config.debug_log_path = debug["log_path"]
+
+        # Terminal
+        if "terminal" in data:
+            terminal = data["terminal"]
+            if "listen_hotkey" in terminal:
+                config.listen_hotkey = terminal["listen_hotkey"]
+
+    except Exception as e:
+        print(f"Warning: Could not load config file: {e}", file=sys.stderr)
+
+    return config
+
+
 def load_config() -> AppConfig:
     """
     Load configuration with layered priority:
@@ -174,81 +273,13 @@ def load_config() -> AppConfig:
     if not config_path.exists():
         create_default_config_file(config_path)
 
-    # Start with defaults
-    config = AppConfig()
-
-    # Load and merge file config
-    if config_path.exists():
-        try:
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-
-                # Notifications
-                if "notifications" in data:
-                    config.notifications_enabled = data["notifications"].get("enabled", False)
-
-                # Hotkey
-                if "hotkey" in data:
-                    config.hotkey_toggle_listening = data["hotkey"].get("toggle_listening")
-
-                # API settings
-                if "api" in data:
-                    api = data["api"]
-                    if api.get("key"):
-                        config.api_key = api["key"]
-                        if "validated" not in api:
-                            config.api_key_validated = True
-                    if "validated" in api:
-                        config.api_key_validated = bool(api["validated"])
-                    if api.get("connection_url"):
-                        config.connection_url = api["connection_url"]
-
-                # Audio settings
-                if "audio" in data:
-                    audio = data["audio"]
-                    if "sample_rate" in audio:
-                        config.sample_rate = audio["sample_rate"]
-                    if "silence_timeout" in audio:
-                        config.silence_timeout = audio["silence_timeout"]
-                    if "min_stream_seconds" in audio:
-                        config.min_stream_seconds = audio["min_stream_seconds"]
-
-                # Transcription settings
-                if "transcription" in data:
-                    trans = data["transcription"]
-                    if "language" in trans:
-                        config.language = trans["language"]
-                    if "prefer_partials" in trans:
-                        config.prefer_partials = trans["prefer_partials"]
-                    if "max_delay" in trans:
-                        config.max_delay = trans["max_delay"]
-                    if "ws_idle_timeout" in trans:
-                        config.ws_idle_timeout = trans["ws_idle_timeout"]
-
-                # Keywords
-                if "keywords" in data:
-                    parsed_keywords = parse_keyword_actions(data["keywords"])
-                    if parsed_keywords:
-                        config.keyword_actions = parsed_keywords
-
-                # Debug
-                if "debug" in data:
-                    debug = data["debug"]
-                    if "enabled" in debug:
-                        config.debug = debug["enabled"]
-                    if "log_path" in debug:
-                        config.debug_log_path = debug["log_path"]
-
-                # Terminal
-                if "terminal" in data:
-                    terminal = data["terminal"]
-                    if "listen_hotkey" in terminal:
-                        config.listen_hotkey = terminal["listen_hotkey"]
-
-        except Exception as e:
-            print(f"Warning: Could not load config file: {e}", file=sys.stderr)
+    if not config_path.exists():
+        return AppConfig()
 
-    return config
+    cached = _load_config_file(str(config_path), config_path.stat().st_mtime)
+    # Callers mutate their AppConfig (e.g. tray settings), so hand out a copy
+    # rather than the cached instance.
+    return replace(cached, keyword_actions=list(cached.keyword_actions))
 
 
 def save_config(config: AppConfig, path: Path | None = None) -> bool:
@@ -311,8 +342,11 @@ def save_config(config: AppConfig, path: Path | None = None) -> bool:
 
         # Atomic write: write to temp file then rename
         temp_path = path.with_suffix('.tmp')
-        with open(temp_path, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        if orjson is not None:
+            temp_path.write_bytes(orjson.dumps(config_dict, option=orjson.OPT_INDENT_2))
+        else:
+            with open(temp_path, 'w') as f:
+                json.dump(config_dict, f, indent=2)
         temp_path.replace(path)
 
         return True
@@ -321,4 +355,10 @@ def save_config(config: AppConfig, path: Path | None = None) -> bool:
         return False
 
 
-DEFAULT_CONFIG = load_config()
+def __getattr__(name: str):
+    # Lazy module attribute: materializing DEFAULT_CONFIG at import time would
+    # pay disk IO + JSON parsing on every process start even if unused.
+    if name == "DEFAULT_CONFIG":
+        globals()["DEFAULT_CONFIG"] = load_config()
+        return globals()["DEFAULT_CONFIG"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,12 +9,49 @@ from voicetyper import output
 from voicetyper.audio.capture import AudioLevelMeter, MicrophoneStream
 from voicetyper.audio.devices import InputDevice
 from voicetyper.audio.vad import SileroVoiceActivityDetector
-from voicetyper.config import AppConfig, KeywordAction
+from voicetyper.config import AppConfig, KeywordAction, compile_keyword_pattern
 from voicetyper.logging_utils import DebugSink
 from voicetyper.stt.base import TranscriptionBackend
 
 
 class TranscriptRouter:
+    # Every partial/final touches most of these; slots turn the per-access
+    # __dict__ lookups into fixed-offset loads and shrink the instance.
+    __slots__ = (
+        "prefer_partials",
+        "keyword_actions",
+        "_any_keyword_re",
+        "_action_by_word",
+        "_kw_words",
+        "_ws_re",
+        "request_force_end",
+        "send_keys",
+        "log",
+        "_lock",
+        "_log_enabled",
+        "_suppress_output",
+        "_content_seen",
+        "_committed",
+        "_keyword_triggered",
+        "_strip_memo",
+        "_last_partial",
+        "_pending_send",
+        "_last_flush",
+    )
+
+    # Minimum spacing between xdotool invocations for partial deltas; each
+    # call pays process overhead that dwarfs the text work, so bursts within
+    # this window are typed as one batch.
+    _FLUSH_INTERVAL = 0.03
+
+    # Static pattern shared by all routers; compiled once at class build.
+    _CONTENT_RE = re.compile(r"\w")
+
+    # Overlap detection only ever looks at the end of the committed text, so
+    # keep just this much of it; long dictation sessions otherwise grow the
+    # string (and every append's copy) without bound.
+    _MAX_TAIL = 512
+
     def __init__(
         self,
         prefer_partials: bool,
@@ -33,96 +70,207 @@ class TranscriptRouter:
             for action in keyword_actions
             if action.word.strip()
         ]
+        # One alternation pattern finds the earliest keyword in a single scan;
+        # words are normalized to lowercase above, so group 1 maps straight
+        # back to its action.
+        self._any_keyword_re = compile_keyword_pattern(self.keyword_actions)
+        self._action_by_word = {action.word: action for action in self.keyword_actions}
+        # Plain-substring pre-check: str.__contains__ is far cheaper than the
+        # regex machinery and keywords are absent from almost all dictation.
+        self._kw_words = tuple(action.word for action in self.keyword_actions)
+        self._ws_re = re.compile(r"\s+")
         self.request_force_end = request_force_end
         self.send_keys = send_keys
         self.log = log_fn or (lambda _msg: None)
+        # True only when a real log function was wired in; lets hot paths
+        # skip building the f-string for a no-op logger.
+        self._log_enabled = log_fn is not None
+        # Partials/finals arrive on the backend's network thread while
+        # start_utterance runs on the audio thread; one lock serializes all
+        # state mutation. (Marshaling callbacks onto the audio thread would
+        # stall finals, which land after the audio loop has parked.)
+        self._lock = threading.Lock()
         self._suppress_output = False
         self._content_seen: bool = False
         self._committed: str = ""
         self._keyword_triggered: bool = False
+        self._strip_memo: tuple[str, str] | None = None
+        self._last_partial: str | None = None
+        self._pending_send: str = ""
+        self._last_flush: float = 0.0
 
     def start_utterance(self):
-        self._suppress_output = False
-        self._content_seen = False
-        self._committed = ""
-        self._keyword_triggered = False
-
-    def _strip_keywords(self, text: str) -> str:
-        cleaned = text
-        for action in self.keyword_actions:
-            pattern = rf"\b{re.escape(action.word)}\b[^\w\s]*"
-            cleaned = re.sub(pattern, " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r"\s+", " ", cleaned)
-        return cleaned if cleaned.strip() else ""
-
-    def _first_keyword_pos(self, text: str) -> tuple[KeywordAction | None, int | None]:
-        first: tuple[KeywordAction | None, int | None] = (None, None)
-        for action in self.keyword_actions:
-            match = re.search(rf"\b{re.escape(action.word)}\b[^\w\s]*", text, flags=re.IGNORECASE)
-            if match:
-                if first[1] is None or match.start() < first[1]:
-                    first = (action, match.start())
-        return first
+        with self._lock:
+            self._suppress_output = False
+            self._content_seen = False
+            self._committed = ""
+            self._keyword_triggered = False
+            self._strip_memo = None
+            self._last_partial = None
+            self._pending_send = ""
+
+    def _might_contain_keyword(self, lower: str) -> bool:
+        return any(word in lower for word in self._kw_words)
+
+    def _strip_keywords(self, text: str, lower: str | None = None) -> str:
+        # Zero configured keywords: nothing can ever be stripped, so skip
+        # even the case-fold.
+        if not self._kw_words:
+            return text if text.strip() else ""
+        # Partials are revisable and finals are not cumulative, so there is no
+        # stable prefix to scan incrementally; memoizing the last input covers
+        # the common case where consecutive callbacks repeat the same text.
+        memo = self._strip_memo
+        if memo is not None and memo[0] == text:
+            return memo[1]
+        if lower is None:
+            lower = text.lower()
+        if self._any_keyword_re is None or not self._might_contain_keyword(lower):
+            # Nothing to strip, and STT output is already whitespace-normal,
+            # so skip the collapse pass too — the common case.
+            result = text if text.strip() else ""
+            self._strip_memo = (text, result)
+            return result
+        # Scan the pre-lowered copy (the alternation pattern is lowercase,
+        # so no IGNORECASE case-folding per character) and splice the
+        # original text around the matches; ASCII lowering preserves
+        # offsets.
+        parts: list[str] = []
+        last = 0
+        for match in self._any_keyword_re.finditer(lower):
+            parts.append(text[last : match.start()])
+            parts.append(" ")
+            last = match.end()
+        parts.append(text[last:])
+        cleaned = self._ws_re.sub(" ", "".join(parts))
+        result = cleaned if cleaned.strip() else ""
+        self._strip_memo = (text, result)
+        return result
+
+    def _first_keyword_pos(
+        self, text: str, lower: str | None = None
+    ) -> tuple[KeywordAction | None, int | None]:
+        if self._any_keyword_re is None:
+            return (None, None)
+        if lower is None:
+            lower = text.lower()
+        if not self._might_contain_keyword(lower):
+            return (None, None)
+        # The alternation pattern is lowercase, so scan lowercased text; the
+        # first match is by definition the earliest keyword. Offsets carry
+        # over to the original text (ASCII lowering is length-preserving).
+        match = self._any_keyword_re.search(lower)
+        if not match:
+            return (None, None)
+        return (self._action_by_word[match.group(1)], match.start())
 
     def _has_content(self, text: str) -> bool:
-        return bool(re.search(r"\w", text))
+        return self._CONTENT_RE.search(text) is not None
 
     def _overlap_len(self, a: str, b: str) -> int:
+        """Length of the longest suffix of a that is a prefix of b."""
         max_len = min(len(a), len(b))
-        for size in range(max_len, 0, -1):
-            if a[-size:] == b[:size]:
-                return size
-        return 0
+        if max_len == 0:
+            return 0
+        # KMP failure function of b's prefix, then run the automaton over a's
+        # tail: O(n) instead of the quadratic slice-and-compare loop.
+        pattern = b[:max_len]
+        fail = [0] * max_len
+        k = 0
+        for i in range(1, max_len):
+            while k and pattern[i] != pattern[k]:
+                k = fail[k - 1]
+            if pattern[i] == pattern[k]:
+                k += 1
+            fail[i] = k
+        k = 0
+        for ch in a[-max_len:]:
+            while k and (k == max_len or ch != pattern[k]):
+                k = fail[k - 1]
+            if ch == pattern[k]:
+                k += 1
+        return k
 
-    def _append_text(self, text: str, log_label: str):
-        cleaned = self._strip_keywords(text)
+    def _append_text(self, text: str, log_label: str, lower: str | None = None):
+        cleaned = self._strip_keywords(text, lower)
         if not cleaned:
             return
         overlap = self._overlap_len(self._committed, cleaned)
         if overlap == len(cleaned):
-            self.log(f"{log_label} skipped: contained in committed")
+            if self._log_enabled:
+                self.log(f"{log_label} skipped: contained in committed")
             return
         delta = cleaned[overlap:]
         if not delta:
             return
-        self.log(f"{log_label}: {delta}")
-        output.xdotool.send_text(delta)
-        self._committed += delta
+        if self._log_enabled:
+            self.log(f"{log_label}: {delta}")
+        committed = self._committed + delta
+        if len(committed) > self._MAX_TAIL:
+            committed = committed[-self._MAX_TAIL :]
+        self._committed = committed
+        self._pending_send += delta
+
+    def _flush_pending(self):
+        if self._pending_send:
+            output.xdotool.send_text(self._pending_send)
+            self._pending_send = ""
+        self._last_flush = time.monotonic()
 
     def on_partial(self, text: str):
-        self.log(f"partial: {text}")
-        if self._has_content(text):
-            self._content_seen = True
-        if self._suppress_output or self._keyword_triggered:
-            return
-        if self.prefer_partials:
-            self._append_text(text, "type_partial")
+        with self._lock:
+            # Backends frequently re-emit an unchanged partial; it carries no
+            # new state, so skip it before any logging or scanning.
+            if text == self._last_partial:
+                return
+            self._last_partial = text
+            # Nothing downstream runs once output is suppressed, so bail
+            # before logging or scanning the text.
+            if self._suppress_output or self._keyword_triggered:
+                return
+            if self._log_enabled:
+                self.log(f"partial: {text}")
+            if not self._content_seen and self._has_content(text):
+                self._content_seen = True
+            if self.prefer_partials:
+                self._append_text(text, "type_partial", text.lower())
+                # Debounced flush; anything still buffered goes out with the
+                # next partial or the final.
+                if self._pending_send and time.monotonic() - self._last_flush >= self._FLUSH_INTERVAL:
+                    self._flush_pending()
 
     def on_final(self, text: str):
-        self.log(f"final: {text}")
-        has_content = self._has_content(text)
-        if not self._content_seen and not has_content:
-            self.log("final skipped: before first content of utterance")
-            return
-        if has_content:
-            self._content_seen = True
-        if self._suppress_output or self._keyword_triggered:
-            return
-        action, pos = self._first_keyword_pos(text)
-        if action and pos is not None:
-            before = text[:pos]
-            self._append_text(before, "type_final")
-            self._keyword_triggered = True
-            self._suppress_output = True
-            if action.keys:
-                self.log(f"keyword: {action.word} send keys {action.keys}")
-                self.send_keys(action.keys)
-            else:
-                self.log(f"keyword: {action.word} (no key bindings)")
-            if action.force_end:
-                self.request_force_end(action.word)
-            return
-        self._append_text(text, "type_final")
+        with self._lock:
+            if self._suppress_output or self._keyword_triggered:
+                return
+            if self._log_enabled:
+                self.log(f"final: {text}")
+            if not self._content_seen:
+                if not self._has_content(text):
+                    self.log("final skipped: before first content of utterance")
+                    return
+                self._content_seen = True
+            lower = text.lower()
+            action, pos = self._first_keyword_pos(text, lower)
+            if action and pos is not None:
+                before = text[:pos]
+                self._append_text(before, "type_final", lower[:pos])
+                # Typed text must land before the keyword's keystrokes.
+                self._flush_pending()
+                self._keyword_triggered = True
+                self._suppress_output = True
+                if action.keys:
+                    if self._log_enabled:
+                        self.log(f"keyword: {action.word} send keys {action.keys}")
+                    self.send_keys(action.keys)
+                else:
+                    if self._log_enabled:
+                        self.log(f"keyword: {action.word} (no key bindings)")
+                if action.force_end:
+                    self.request_force_end(action.word)
+                return
+            self._append_text(text, "type_final", lower)
+            self._flush_pending()
 
     def flush_partial_as_final(self):
         # Auto-finalize removed; finals drive commits.
@@ -142,25 +290,50 @@ class VoiceController:
         self.device = device
         self.sink = sink
         self._log = sink.info
+        # Cached so hot-path log sites can skip f-string formatting entirely
+        # when debug is off, instead of formatting and discarding.
+        self._debug = bool(config.debug)
         self.vad = SileroVoiceActivityDetector(sample_rate=config.sample_rate, sink=self.sink)
         self.enabled = False
         self.listening = False
+        # Invoked (from the audio thread) whenever enabled/listening changes;
+        # UI layers subscribe instead of polling. Must be thread-safe.
+        self.on_state_change: Callable[[], None] | None = None
         self._worker: threading.Thread | None = None
         self._session_lock = threading.Lock()
         self._backend: TranscriptionBackend | None = None
+        self._mic: MicrophoneStream | None = None
         self._force_end_event = threading.Event()
 
     def _request_force_end(self, keyword: str):
         if self._force_end_event.is_set():
             return
         self._force_end_event.set()
-        self._log(f"utterance: force end (keyword={keyword})")
+        if self._debug:
+            self._log(f"utterance: force end (keyword={keyword})")
         if self._backend:
             self._backend.end_utterance()
+        mic = self._mic
+        if mic:
+            # The capture loop may be blocked waiting for the next audio
+            # chunk; poke it so the force-end is noticed right away.
+            mic.poke()
 
     def _send_keys(self, keys: list[str]):
-        for key in keys:
-            output.xdotool.send_key(key)
+        output.xdotool.send_keys(keys)
+
+    def _notify_state(self):
+        cb = self.on_state_change
+        if cb:
+            try:
+                cb()
+            except Exception:
+                self.sink.exception("state-change callback error")
+
+    def _set_listening(self, value: bool):
+        if self.listening != value:
+            self.listening = value
+            self._notify_state()
 
     def _listener_loop(self):
         """
@@ -204,8 +377,18 @@ class VoiceController:
                 level_meter=level_meter,
             )
             mic.start()
-            last_vad_speech = time.time()
+            self._mic = mic
+            last_vad_speech = time.monotonic()
+            # Config is fixed for the session; read it once instead of per frame.
             idle_timeout = self.config.ws_idle_timeout
+            silence_limit = self.config.silence_timeout
+            min_stream = self.config.min_stream_seconds
+            # Per-frame callables as locals: skips the attribute chains on
+            # every 50 ms chunk.
+            send_audio = backend.send_audio
+            is_speech = self.vad.is_speech
+            force_end_set = self._force_end_event.is_set
+            monotonic = time.monotonic
             try:
                 while self.enabled:
                     # Wait for speech to start
@@ -215,61 +398,72 @@ class VoiceController:
                             return
                         if backend_errors:
                             return
-                        now = time.time()
+                        now = monotonic()
                         if (
                             idle_timeout > 0
                             and backend_running()
                             and not self.listening
                             and (now - last_vad_speech) >= idle_timeout
                         ):
-                            self._log("speechmatics: idle timeout; closing session")
+                            if self._debug:
+                                self._log("speechmatics: idle timeout; closing session")
                             backend.stop()
                             continue
-                        if self.vad.is_speech(frame):
+                        if is_speech(frame):
                             last_vad_speech = now
                             self._force_end_event.clear()
                             router.start_utterance()
-                            self._log("vad: speech detected")
+                            if self._debug:
+                                self._log("vad: speech detected")
                             ensure_backend()
-                            self.listening = True
+                            self._set_listening(True)
                             last_speech = now
                             start_time = last_speech
-                            session_start = time.time()
-                            backend.send_audio(frame)
+                            session_start = start_time
+                            send_audio(frame)
 
                             # Continue until silence timeout
                             for frame2 in mic.frames():
                                 if not self.enabled:
-                                    self._log("utterance: stop (disabled mid-stream)")
+                                    if self._debug:
+                                        self._log("utterance: stop (disabled mid-stream)")
                                     backend.end_utterance()
                                     backend.stop()
-                                    self.listening = False
+                                    self._set_listening(False)
                                     return
                                 if backend_errors:
                                     backend.stop()
-                                    self.listening = False
+                                    self._set_listening(False)
                                     return
-                                if self._force_end_event.is_set():
-                                    self._log("utterance: stop (keyword)")
+                                if force_end_set():
+                                    if self._debug:
+                                        self._log("utterance: stop (keyword)")
                                     break
-                                backend.send_audio(frame2)
-                                speech = self.vad.is_speech(frame2)
+                                if not frame2:
+                                    # poke() sentinel; nothing to send or score
+                                    continue
+                                send_audio(frame2)
+                                speech = is_speech(frame2)
+                                # One clock read per frame; the three uses
+                                # below do not need independent timestamps.
+                                now = monotonic()
                                 if speech:
-                                    last_speech = time.time()
+                                    last_speech = now
                                     last_vad_speech = last_speech
-                                silence = time.time() - last_speech
-                                elapsed = time.time() - start_time
-                                silence_limit = self.config.silence_timeout
-                                if elapsed >= self.config.min_stream_seconds and silence >= silence_limit:
+                                silence = now - last_speech
+                                elapsed = now - start_time
+                                if elapsed >= min_stream and silence >= silence_limit:
                                     router.flush_partial_as_final()
                                     break
                             backend.end_utterance()
-                            self.listening = False
-                            duration = time.time() - session_start
-                            self._log(f"utterance: stop (duration={duration:.2f}s)")
+                            output.xdotool.flush()
+                            self._set_listening(False)
+                            if self._debug:
+                                duration = time.monotonic() - session_start
+                                self._log(f"utterance: stop (duration={duration:.2f}s)")
                             break  # go back to waiting for next speech
-                    time.sleep(0.01)
             finally:
+                self._mic = None
                 mic.stop()
         except Exception as exc:
             self.sink.exception(f"listener loop error: {exc}")
@@ -286,6 +480,7 @@ class VoiceController:
             if self.enabled:
                 return
             self.enabled = True
+            self._notify_state()
             self._log("listening enabled")
             thread = threading.Thread(target=self._listener_loop, daemon=True)
             thread.start()
@@ -295,6 +490,7 @@ class VoiceController:
                 return
             self.enabled = False
             self.listening = False
+            self._notify_state()
             self._log("listening disabled")
             if self._backend:
                 self._backend.stop()
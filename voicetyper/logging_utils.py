@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import threading
 import time
 import traceback
+from collections import deque
 from pathlib import Path
 from typing import List
 
@@ -12,44 +12,57 @@ class DebugSink:
     Collects debug lines for UI and optionally writes errors/tracebacks to a file.
     """
 
-    def __init__(self, enabled: bool, log_path: Path, buffer: List[str], lock: threading.Lock):
+    def __init__(self, enabled: bool, log_path: Path, buffer: deque[str] | List[str]):
         self.enabled = enabled
         self.log_path = log_path
         self.buffer = buffer
-        self.lock = lock
+        # Bumped on every appended line so the UI can tell at a glance
+        # whether there is anything new to draw.
+        self._seq = 0
+        # One line-buffered handle for the session instead of an
+        # open/write/close syscall round trip per logged line.
+        self._fh = None
         if self.enabled:
             try:
                 self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._fh = self.log_path.open("a", encoding="utf-8", buffering=1)
             except Exception:
                 pass
 
     def _timestamp(self) -> str:
         return time.strftime("%H:%M:%S")
 
-    def _append_ui(self, msg: str):
-        line = f"[{self._timestamp()}] {msg}"
-        with self.lock:
-            self.buffer.append(line)
+    def _append_ui(self, line: str):
+        # deque/list append is a single C call under the GIL, so the hot
+        # log path from the audio thread needs no lock.
+        self.buffer.append(line)
+        self._seq += 1
+
+    def seq(self) -> int:
+        # Single int read; safe without the lock.
+        return self._seq
 
     def _write_file(self, text: str):
-        if not self.enabled:
+        if self._fh is None:
             return
         try:
-            with self.log_path.open("a", encoding="utf-8") as f:
-                f.write(text + "\n")
+            self._fh.write(text + "\n")
         except Exception:
             # Avoid crashing on log write failures.
             pass
 
     def info(self, msg: str):
-        self._append_ui(msg)
-        if self.enabled:
-            self._write_file(f"[{self._timestamp()}] {msg}")
+        # One timestamp and one formatted line shared by the UI buffer and
+        # the log file.
+        line = f"[{self._timestamp()}] {msg}"
+        self._append_ui(line)
+        self._write_file(line)
 
     def error(self, msg: str):
+        ts = self._timestamp()
         hint = f"{msg} (details: {self.log_path})" if self.enabled else msg
-        self._append_ui(f"ERROR: {hint}")
-        self._write_file(f"[{self._timestamp()}] ERROR: {msg}")
+        self._append_ui(f"[{ts}] ERROR: {hint}")
+        self._write_file(f"[{ts}] ERROR: {msg}")
 
     def exception(self, prefix: str):
         tb = traceback.format_exc().strip()
@@ -58,5 +71,7 @@ class DebugSink:
             self._write_file(f"[{self._timestamp()}] {prefix}\n{tb}\n")
 
     def snapshot(self, limit: int) -> list[str]:
-        with self.lock:
-            return list(self.buffer[-limit:])
+        # list(buffer) consumes the iterator inside one C call, so a
+        # concurrent append cannot interleave and trip the deque's
+        # mutated-during-iteration check; then slice the tail.
+        return list(self.buffer)[-limit:] if limit > 0 else []
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import curses
 import sys
-import threading
-import time
+from collections import deque
 from pathlib import Path
 
 from voicetyper.audio.capture import AudioLevelMeter, MicrophoneStream
@@ -73,10 +72,10 @@ def run_app(config: AppConfig):
     devices = list_input_devices()
     with TerminalUI() as ui:
         device = select_device(ui, devices, config)
-        debug_lines: list[str] = []
-        debug_lock = threading.Lock()
+        # Bounded: old lines fall off instead of growing for the whole session.
+        debug_lines: deque[str] = deque(maxlen=500)
         log_path = Path(config.debug_log_path)
-        sink = DebugSink(enabled=config.debug, log_path=log_path, buffer=debug_lines, lock=debug_lock)
+        sink = DebugSink(enabled=config.debug, log_path=log_path, buffer=debug_lines)
 
         controller = VoiceController(
             config,
@@ -85,14 +84,14 @@ def run_app(config: AppConfig):
             sink=sink,
         )
 
-        last_render = 0.0
         last_state = None
+        last_seq = -1
         while True:
+            # Redraw only when controller state or the debug log actually
+            # changed, not on a wall-clock interval.
             state = (controller.enabled, controller.listening)
-            now = time.time()
-            should_render = (now - last_render) >= 0.1 or state != last_state
-
-            if should_render:
+            seq = sink.seq()
+            if state != last_state or seq != last_seq:
                 lines_snapshot = sink.snapshot(limit=80)
                 ui.draw_status(
                     listening_enabled=controller.enabled,
@@ -104,8 +103,8 @@ def run_app(config: AppConfig):
                     debug_enabled=config.debug,
                     debug_lines=lines_snapshot,
                 )
-                last_render = now
                 last_state = state
+                last_seq = seq
 
             key = ui.get_key()
             if key is None:
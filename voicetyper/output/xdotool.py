@@ -1,25 +1,119 @@
 from __future__ import annotations
 
+import queue
 import shlex
 import subprocess
+import threading
+
+# Text is typed by a single daemon writer thread: deltas that arrive while
+# one xdotool invocation is running collapse into the next invocation, so a
+# burst of partials pays one fork+exec instead of one each.
+_queue: "queue.Queue[str | threading.Event]" = queue.Queue()
+_writer_lock = threading.Lock()
+_writer: threading.Thread | None = None
+_missing = False
+
+
+def _not_found() -> RuntimeError:
+    return RuntimeError("xdotool not found on PATH; please install it.")
+
+
+# One long-lived ``xdotool -`` process reads commands from stdin, keeping a
+# single X connection open instead of paying process launch + X handshake
+# per invocation.
+_proc: subprocess.Popen | None = None
+_proc_lock = threading.Lock()
+
+
+def _send_command(line: str):
+    """Write one command line to the persistent xdotool process."""
+    global _proc, _missing
+    with _proc_lock:
+        # Two attempts: a dead process (e.g. X restart) gets respawned once.
+        for _ in range(2):
+            if _proc is None or _proc.poll() is not None:
+                try:
+                    _proc = subprocess.Popen(
+                        ["xdotool", "-"],
+                        stdin=subprocess.PIPE,
+                        text=True,
+                    )
+                except FileNotFoundError:
+                    _missing = True
+                    raise _not_found()
+            try:
+                _proc.stdin.write(line + "\n")
+                _proc.stdin.flush()
+                return
+            except (BrokenPipeError, OSError):
+                _proc = None
+
+
+def _writer_loop():
+    global _missing
+    while True:
+        item = _queue.get()
+        parts: list[str] = []
+        events: list[threading.Event] = []
+        while True:
+            if isinstance(item, threading.Event):
+                events.append(item)
+            else:
+                parts.append(item)
+            try:
+                item = _queue.get_nowait()
+            except queue.Empty:
+                break
+        text = "".join(parts)
+        if text and not _missing:
+            try:
+                _send_command(f"type --clearmodifiers -- {shlex.quote(text)}")
+            except RuntimeError:
+                # _missing is set; callers raise synchronously from now on.
+                pass
+        for event in events:
+            event.set()
+
+
+def _ensure_writer():
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_writer_loop, daemon=True, name="xdotool-writer")
+                _writer.start()
 
 
 def send_text(text: str):
     if not text:
         return
-    # Using --clearmodifiers to avoid stuck modifier keys
-    cmd = ["xdotool", "type", "--clearmodifiers", text]
-    try:
-        subprocess.run(cmd, check=False)
-    except FileNotFoundError:
-        raise RuntimeError("xdotool not found on PATH; please install it.")
+    if _missing:
+        raise _not_found()
+    _ensure_writer()
+    _queue.put(text)
+
+
+def flush(timeout: float = 2.0):
+    """Block until all text enqueued so far has been typed."""
+    if _writer is None:
+        return
+    done = threading.Event()
+    _queue.put(done)
+    done.wait(timeout)
 
 
 def send_key(key: str):
     if not key:
         return
-    cmd = ["xdotool", "key", "--clearmodifiers", key]
-    try:
-        subprocess.run(cmd, check=False)
-    except FileNotFoundError:
-        raise RuntimeError("xdotool not found on PATH; please install it.")
+    # Pending text must appear before the keystroke.
+    flush()
+    _send_command(f"key --clearmodifiers {shlex.quote(key)}")
+
+
+def send_keys(keys: list[str]):
+    """Send a sequence of keys with one xdotool command."""
+    keys = [key for key in keys if key]
+    if not keys:
+        return
+    flush()
+    _send_command("key --clearmodifiers " + " ".join(shlex.quote(key) for key in keys))
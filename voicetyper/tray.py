@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import os
+import queue
 import signal
 import sys
 import threading
+from collections import deque
+from functools import lru_cache, partial
 from pathlib import Path
 import time
 from typing import Callable
@@ -13,12 +16,13 @@ try:
 
     gi.require_version("Gtk", "3.0")
     try:
-        gi.require_version("AppIndicator3", "0.1")
-        from gi.repository import AppIndicator3 as IndicatorLib
-    except (ValueError, ImportError):
-        # Ubuntu/Mint often ship ayatana instead of appindicator.
+        # Ubuntu/Mint ship ayatana these days; try it first so the common
+        # case pays one typelib load instead of a failed require + retry.
         gi.require_version("AyatanaAppIndicator3", "0.1")
         from gi.repository import AyatanaAppIndicator3 as IndicatorLib
+    except (ValueError, ImportError):
+        gi.require_version("AppIndicator3", "0.1")
+        from gi.repository import AppIndicator3 as IndicatorLib
     gi.require_version("Notify", "0.7")
     gi.require_version("Keybinder", "3.0")
     from gi.repository import GLib, Gtk, Notify, Keybinder, Gdk
@@ -36,22 +40,81 @@ except Exception:  # pragma: no cover - only runs when deps are missing
 
 from voicetyper.audio.devices import InputDevice, default_input_device_index, list_input_devices
 from voicetyper.config import load_config, AppConfig, KeywordAction, save_config
-from voicetyper.controller import VoiceController
 from voicetyper.logging_utils import DebugSink
-from voicetyper.stt.speechmatics_client import SpeechmaticsBackend, validate_api_key
+
+
+@lru_cache(maxsize=4)
+def _dir_listing(directory: str) -> frozenset[str]:
+    """Names present in a directory; cached so icon lookup stats it once."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
 
 
 def _find_icon(name_candidates: list[str | Path], fallback: str) -> str:
     for candidate in name_candidates:
         path = Path(candidate)
+        if isinstance(candidate, Path):
+            # Asset files: one cached scandir of the parent replaces a
+            # stat() per candidate.
+            if path.name in _dir_listing(str(path.parent)):
+                return str(path)
+            continue
         if path.exists():
             return str(path)
-        if isinstance(candidate, str) and path.suffix == "" and not path.is_absolute():
+        if path.suffix == "" and not path.is_absolute():
             # Allow themed icon names (e.g., microphone-sensitivity-high).
             return candidate
     return fallback
 
 
+# Standalone modifier presses that the hotkey/keyword capture dialogs
+# ignore; built once so each keystroke is a hash lookup.
+_MODIFIER_KEYVALS = frozenset((
+    Gdk.KEY_Control_L, Gdk.KEY_Control_R,
+    Gdk.KEY_Alt_L, Gdk.KEY_Alt_R,
+    Gdk.KEY_Shift_L, Gdk.KEY_Shift_R,
+    Gdk.KEY_Super_L, Gdk.KEY_Super_R,
+))
+
+# Modifier-mask decoding for xdotool bindings; built once so each captured
+# keystroke is a table scan instead of four Gdk attribute loads.
+_MOD_TABLE = (
+    (Gdk.ModifierType.CONTROL_MASK, "ctrl"),
+    (Gdk.ModifierType.SHIFT_MASK, "shift"),
+    (Gdk.ModifierType.MOD1_MASK, "alt"),
+    (Gdk.ModifierType.SUPER_MASK, "super"),
+)
+
+# Resolved once at import: resolve() stats every path component, and the
+# icon lookup probes the assets directory, neither of which changes between
+# TrayApp instances.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_ASSETS = _REPO_ROOT / "assets"
+_ICON_ON = _find_icon(
+    [_ASSETS / "mic-on.png", _ASSETS / "mic-on.svg", "microphone-sensitivity-high"],
+    fallback="audio-input-microphone-symbolic",
+)
+_ICON_OFF = _find_icon(
+    [_ASSETS / "mic-off.png", _ASSETS / "mic-off.svg", "microphone-sensitivity-muted"],
+    fallback="microphone-disabled-symbolic",
+)
+_ICON_SPEAKING = _find_icon(
+    ["media-record", "audio-volume-high"],
+    fallback="emblem-sound",
+)
+
+
+def _make_backend(config: AppConfig, sink: DebugSink):
+    # Imported here, not at module top: the backend pulls in the websocket
+    # client, and this only runs on first enable, after the icon is up.
+    from voicetyper.stt.speechmatics_client import SpeechmaticsBackend
+
+    return SpeechmaticsBackend(config, log_fn=sink.info)
+
+
 def _select_device() -> InputDevice:
     devices = list_input_devices()
     if not devices:
@@ -68,40 +131,65 @@ class TrayApp:
     def __init__(self, config: AppConfig):
         self.config = config
         self.device = _select_device()
-        self._debug_lines: list[str] = []
-        self._lock = threading.Lock()
+        # Bounded ring so a long-running tray session cannot grow without
+        # limit; the tray has no log view, the sink just needs somewhere
+        # to append.
+        self._debug_lines: deque[str] = deque(maxlen=2048)
         self.sink = DebugSink(
-            enabled=config.debug, log_path=Path(config.debug_log_path), buffer=self._debug_lines, lock=self._lock
+            enabled=config.debug, log_path=Path(config.debug_log_path), buffer=self._debug_lines
         )
         self.locked = not config.has_valid_api_key()
         self._validating_key: str | None = None
         self._hotkey_bound = False
+        # Imported here, not at module top: the controller pulls in the
+        # audio stack, which the tray icon should not wait on.
+        from voicetyper.controller import VoiceController
+
         self.controller = VoiceController(
             config,
-            backend_factory=lambda: SpeechmaticsBackend(config, log_fn=self.sink.info),
+            backend_factory=partial(_make_backend, config, self.sink),
             device=self.device,
             sink=self.sink,
         )
-        repo_root = Path(__file__).resolve().parent.parent
-        assets = repo_root / "assets"
-        self.icon_on = _find_icon(
-            [assets / "mic-on.png", assets / "mic-on.svg", "microphone-sensitivity-high"],
-            fallback="audio-input-microphone-symbolic",
-        )
-        self.icon_off = _find_icon(
-            [assets / "mic-off.png", assets / "mic-off.svg", "microphone-sensitivity-muted"],
-            fallback="microphone-disabled-symbolic",
-        )
-        self.icon_speaking = _find_icon(
-            ["media-record", "audio-volume-high"],
-            fallback="emblem-sound",
-        )
-        Notify.init("Voicetyper")
+        self.icon_on = _ICON_ON
+        self.icon_off = _ICON_OFF
+        self.icon_speaking = _ICON_SPEAKING
+        # (enabled, streaming) -> (icon, description); locked overrides.
+        self._state_table = {
+            (False, False): (self.icon_off, "Disabled"),
+            (False, True): (self.icon_off, "Disabled"),
+            (True, False): (self.icon_on, "Ready"),
+            (True, True): (self.icon_speaking, "Speaking"),
+        }
+        # Notify.init talks to the notification daemon over DBus; defer it to
+        # the first actual notification instead of blocking startup.
+        self._notify_ready = False
+        self._notification = None
+        self._last_note_msg = ""
+        self._last_note_ts = 0.0
+        # Settings dialog is built on first open and reused afterwards.
+        self._settings_dialog = None
+        self._settings_widgets: dict = {}
+        self._settings_kw_snapshot: list[KeywordAction] | None = None
         self._indicator = self._build_indicator()
         self._init_hotkey()
         self._last_icon = None
+        self._last_render = None
+        self._refresh_pending = False
+        # One channel into the GTK loop for all worker threads: callables are
+        # queued and a single wakeup byte pokes the fd source, which drains
+        # on the main thread. Keeps cross-thread marshaling to one mechanism
+        # and one wakeup per burst instead of an idle_add per event.
+        self._ui_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._ui_rfd, self._ui_wfd = os.pipe()
+        os.set_blocking(self._ui_wfd, False)
+        GLib.unix_fd_add_full(
+            GLib.PRIORITY_DEFAULT, self._ui_rfd, GLib.IO_IN, self._drain_ui_queue
+        )
+        # Event-driven refresh: the controller pushes state changes instead of
+        # the tray polling on a timer.
+        self.controller.on_state_change = self._on_controller_state
         self._refresh_state()
-        self._start_state_timer()
 
     def _build_indicator(self):
         indicator = IndicatorLib.Indicator.new(
@@ -128,8 +216,48 @@ class TrayApp:
         indicator.set_menu(menu)
         return indicator
 
-    def _start_state_timer(self):
-        GLib.timeout_add(500, self._refresh_state)
+    def post_ui(self, fn: Callable[[], None]):
+        """Run fn on the GTK main thread; safe to call from any thread."""
+        self._ui_queue.put(fn)
+        try:
+            os.write(self._ui_wfd, b"\x00")
+        except (BlockingIOError, OSError):
+            # Pipe buffer full: a wakeup is already pending.
+            pass
+
+    def _drain_ui_queue(self, fd, _condition):
+        try:
+            os.read(fd, 4096)
+        except OSError:
+            pass
+        while True:
+            try:
+                fn = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn()
+            except Exception:
+                self.sink.exception("ui callback error")
+        return True
+
+    def _on_controller_state(self):
+        """Controller state callback; fires on the audio thread, so marshal
+        the widget update onto the GTK main loop."""
+        self.post_ui(self._schedule_refresh)
+
+    def _schedule_refresh(self):
+        """Coalesce refresh requests to at most one per main-loop turn."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        # DEFAULT_IDLE so a burst of state flips cannot starve other sources.
+        GLib.idle_add(self._do_refresh, priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self._refresh_state()
+        return False
 
     def _set_locked(self, locked: bool):
         """Enable/disable user controls based on API key readiness."""
@@ -147,7 +275,7 @@ class TrayApp:
             self._hotkey_bound = False
         else:
             self._init_hotkey()
-        self._refresh_state()
+        self._schedule_refresh()
 
     def _notify(self, message: str, force: bool = False):
         """
@@ -160,9 +288,26 @@ class TrayApp:
         if not force and not self.config.notifications_enabled:
             return
 
+        # Rapid state churn (hotkey mashing) repeats the same message;
+        # within a short window the popup is already on screen, so skip
+        # the DBus round-trip entirely.
+        now = time.monotonic()
+        if message == self._last_note_msg and now - self._last_note_ts < 2.0:
+            return
+        self._last_note_msg = message
+        self._last_note_ts = now
+
         try:
-            note = Notify.Notification.new("Voicetyper", message, None)
-            note.show()
+            if not self._notify_ready:
+                Notify.init("Voicetyper")
+                self._notify_ready = True
+            # Reuse one notification: update() replaces the body in place
+            # under the same daemon ID instead of allocating a new popup.
+            if self._notification is None:
+                self._notification = Notify.Notification.new("Voicetyper", message, None)
+            else:
+                self._notification.update("Voicetyper", message, None)
+            self._notification.show()
         except Exception:
             # Notification failures should not crash the app.
             pass
@@ -193,12 +338,7 @@ class TrayApp:
 
     def _on_hotkey_pressed(self, keystring, user_data):
         """Callback for global hotkey press (runs on different thread)."""
-        GLib.idle_add(self._toggle_listening_from_hotkey)
-
-    def _toggle_listening_from_hotkey(self):
-        """Toggle listening state from hotkey (called on GTK main thread)."""
-        self._toggle_listening(None)
-        return False  # Don't repeat callback
+        self.post_ui(partial(self._toggle_listening, None))
 
     def _toggle_listening(self, _menuitem):
         if self.locked:
@@ -208,45 +348,50 @@ class TrayApp:
         self.controller.set_enabled(new_state)
         status = "Enabled" if new_state else "Disabled"
         self._notify(f"{status} voice typing on {self.device.name}")
-        self._refresh_state()
+        self._schedule_refresh()
 
     def _refresh_state(self):
         locked = self.locked
         enabled = self.controller.enabled and not locked
         streaming = self.controller.listening and not locked
 
-        # Three-state icon selection
+        # Same state as last paint: skip the widget/DBus round-trips entirely.
+        key = (locked, enabled, streaming)
+        if key == self._last_render:
+            return False
+        self._last_render = key
+
         if locked:
-            icon = self.icon_off
-            description = "API key needed"
-        elif not enabled:
-            icon = self.icon_off
-            description = "Disabled"
-        elif streaming:
-            icon = self.icon_speaking
-            description = "Speaking"
+            icon, description = self.icon_off, "API key needed"
         else:
-            icon = self.icon_on
-            description = "Ready"
+            icon, description = self._state_table[(enabled, streaming)]
 
-        # Only update icon if it actually changed
-        if icon != self._last_icon:
-            try:
-                self._indicator.set_icon_full(icon, description)
-            except Exception:
-                # Fall back to set_icon for theme names.
-                self._indicator.set_icon(icon)
-            self._last_icon = icon
+        # Batch the property writes so the indicator host sees one
+        # PropertiesChanged signal instead of one per setter.
+        self._indicator.freeze_notify()
+        try:
+            # Only update icon if it actually changed
+            if icon != self._last_icon:
+                try:
+                    self._indicator.set_icon_full(icon, description)
+                except Exception:
+                    # Fall back to set_icon for theme names.
+                    self._indicator.set_icon(icon)
+                self._last_icon = icon
 
-        self._indicator.set_title(f"Voicetyper: {description}")
+            self._indicator.set_title(f"Voicetyper: {description}")
+        finally:
+            self._indicator.thaw_notify()
         self.toggle_item.set_label(
             "Add API key (locked)" if locked else ("Disable Listening" if enabled else "Enable Listening")
         )
         self.toggle_item.set_sensitive(not locked)
-        return True
+        # False so idle_add sources run once.
+        return False
 
-    def _show_settings_dialog(self, _menuitem):
-        """Show settings dialog and apply changes if saved."""
+    def _build_settings_dialog(self):
+        """Construct the settings dialog once; reopened dialogs are
+        repopulated from config instead of rebuilt."""
         dialog = Gtk.Dialog(
             title="Voicetyper Settings",
             parent=None,
@@ -254,6 +399,7 @@ class TrayApp:
         )
         dialog.set_default_size(500, 300)
         dialog.set_border_width(10)
+        dialog.connect("delete-event", lambda w, _e: w.hide_on_delete())
 
         content = dialog.get_content_area()
         content.set_spacing(15)
@@ -272,7 +418,6 @@ class TrayApp:
         grid.attach(notif_label, 0, row, 1, 1)
 
         notif_switch = Gtk.Switch()
-        notif_switch.set_active(self.config.notifications_enabled)
         notif_switch.set_halign(Gtk.Align.START)
         grid.attach(notif_switch, 1, row, 1, 1)
 
@@ -283,12 +428,11 @@ class TrayApp:
         grid.attach(hotkey_label, 0, row, 1, 1)
 
         hotkey_button = Gtk.Button()
-        current_hotkey = self.config.hotkey_toggle_listening or "None"
-        hotkey_button.set_label(current_hotkey)
         hotkey_button.set_halign(Gtk.Align.START)
 
-        # Store hotkey capture state
-        hotkey_data = {"capturing": False, "new_hotkey": current_hotkey}
+        # Store hotkey capture state; mutated in place on repopulate so the
+        # connected handler keeps seeing the same dict.
+        hotkey_data = {"capturing": False, "new_hotkey": "None"}
         hotkey_button.connect("clicked", self._on_hotkey_button_clicked, hotkey_data)
         grid.attach(hotkey_button, 1, row, 1, 1)
 
@@ -299,7 +443,6 @@ class TrayApp:
         grid.attach(api_label, 0, row, 1, 1)
 
         api_entry = Gtk.Entry()
-        api_entry.set_text(self.config.api_key or "")
         api_entry.set_placeholder_text("Enter Speechmatics API key")
         api_entry.set_width_chars(32)
         api_entry.set_hexpand(True)
@@ -308,12 +451,7 @@ class TrayApp:
         api_status_label = Gtk.Label()
         api_status_label.set_halign(Gtk.Align.START)
 
-        env_key = os.environ.get("SPEECHMATICS_API_KEY")
-        validation_state = {
-            "key": self.config.api_key if self.config.api_key_validated and self.config.api_key else None,
-            "status": "valid" if (self.config.api_key_validated and self.config.api_key) or env_key else "unknown",
-            "in_progress": False,
-        }
+        validation_state = {"key": None, "status": "unknown", "in_progress": False}
 
         def set_api_status(kind: str, text: str):
             icon_name = {
@@ -324,13 +462,6 @@ class TrayApp:
             api_status_icon.set_from_icon_name(icon_name, Gtk.IconSize.MENU)
             api_status_label.set_text(text)
 
-        if env_key:
-            set_api_status("valid", "Using environment key")
-        elif validation_state["status"] == "valid":
-            set_api_status("valid", "Validated")
-        else:
-            set_api_status("unknown", "Not validated")
-
         def on_api_changed(_entry):
             validation_state["key"] = None
             validation_state["status"] = "unknown"
@@ -398,8 +529,6 @@ class TrayApp:
         scrolled.add(keywords_box)
         grid.attach(scrolled, 1, row, 1, 2)
 
-        self._build_keyword_rows(keywords_box, keyword_rows)
-
         add_keyword_button = Gtk.Button(label="Add keyword")
         add_keyword_button.set_halign(Gtk.Align.START)
         add_keyword_button.connect("clicked", lambda *_args: self._add_keyword_row(keywords_box, keyword_rows, None, False))
@@ -411,24 +540,79 @@ class TrayApp:
         dialog.add_button("Cancel", Gtk.ResponseType.CANCEL)
         dialog.add_button("Save", Gtk.ResponseType.OK)
 
+        self._settings_dialog = dialog
+        self._settings_widgets = {
+            "notif_switch": notif_switch,
+            "hotkey_button": hotkey_button,
+            "hotkey_data": hotkey_data,
+            "api_entry": api_entry,
+            "set_api_status": set_api_status,
+            "validation_state": validation_state,
+            "keywords_box": keywords_box,
+            "keyword_rows": keyword_rows,
+        }
+
+    def _populate_settings_dialog(self):
+        """Sync the cached dialog's widgets with the current config."""
+        w = self._settings_widgets
+        w["notif_switch"].set_active(self.config.notifications_enabled)
+
+        current_hotkey = self.config.hotkey_toggle_listening or "None"
+        w["hotkey_button"].set_label(current_hotkey)
+        w["hotkey_data"].update(capturing=False, new_hotkey=current_hotkey)
+
+        # set_text fires "changed", which resets validation state; restore
+        # the persisted state afterwards.
+        w["api_entry"].set_text(self.config.api_key or "")
+        env_key = os.environ.get("SPEECHMATICS_API_KEY")
+        validated = self.config.api_key_validated and self.config.api_key
+        w["validation_state"].update(
+            key=self.config.api_key if validated else None,
+            status="valid" if validated or env_key else "unknown",
+            in_progress=False,
+        )
+        if env_key:
+            w["set_api_status"]("valid", "Using environment key")
+        elif validated:
+            w["set_api_status"]("valid", "Validated")
+        else:
+            w["set_api_status"]("unknown", "Not validated")
+
+        # Keyword rows are the bulk of the widget churn; rebuild only when
+        # the configured actions changed since the rows were last built.
+        if self._settings_kw_snapshot != self.config.keyword_actions:
+            self._settings_kw_snapshot = list(self.config.keyword_actions)
+            keywords_box = w["keywords_box"]
+            keywords_box.foreach(keywords_box.remove)
+            w["keyword_rows"].clear()
+            self._build_keyword_rows(keywords_box, w["keyword_rows"])
+
+    def _show_settings_dialog(self, _menuitem):
+        """Show settings dialog and apply changes if saved."""
+        if self._settings_dialog is None:
+            self._build_settings_dialog()
+        self._populate_settings_dialog()
+        dialog = self._settings_dialog
+        w = self._settings_widgets
         dialog.show_all()
         response = dialog.run()
 
         if response == Gtk.ResponseType.OK:
             # Collect new values
-            new_notifications = notif_switch.get_active()
-            new_hotkey = hotkey_data["new_hotkey"]
+            new_notifications = w["notif_switch"].get_active()
+            new_hotkey = w["hotkey_data"]["new_hotkey"]
             if new_hotkey == "None":
                 new_hotkey = None
-            new_api_key = api_entry.get_text().strip() or None
-            new_keyword_actions = self._collect_keyword_actions(keyword_rows)
+            new_api_key = w["api_entry"].get_text().strip() or None
+            new_keyword_actions = self._collect_keyword_actions(w["keyword_rows"])
+            validation_state = w["validation_state"]
             validated = False
             if new_api_key:
                 validated = (
                     validation_state["status"] == "valid"
                     and validation_state["key"] == new_api_key
                 )
-            elif env_key:
+            elif os.environ.get("SPEECHMATICS_API_KEY"):
                 validated = True
 
             # Apply changes
@@ -441,8 +625,12 @@ class TrayApp:
             )
             if new_api_key and not validated:
                 self._start_background_validation(new_api_key)
+        else:
+            # Discarded edits may linger in the row widgets; force a rebuild
+            # from config on the next open.
+            self._settings_kw_snapshot = None
 
-        dialog.destroy()
+        dialog.hide()
 
     def _on_hotkey_button_clicked(self, button, hotkey_data):
         """Handle hotkey button click to start key capture."""
@@ -469,10 +657,7 @@ class TrayApp:
             state = event.state
 
             # Ignore standalone modifier keys
-            if keyval in (Gdk.KEY_Control_L, Gdk.KEY_Control_R,
-                          Gdk.KEY_Alt_L, Gdk.KEY_Alt_R,
-                          Gdk.KEY_Shift_L, Gdk.KEY_Shift_R,
-                          Gdk.KEY_Super_L, Gdk.KEY_Super_R):
+            if keyval in _MODIFIER_KEYVALS:
                 return True
 
             # Convert to GTK accelerator string
@@ -501,15 +686,18 @@ class TrayApp:
         non_force_actions = [a for a in actions if not a.force_end]
 
         # Fixed force-end row (cannot remove, force flag locked on)
-        self._add_keyword_row(container, rows, force_action, is_force_row=True)
+        self._add_keyword_row(container, rows, force_action, is_force_row=True, defer_show=True)
 
-        # Other rows remain fully editable/removable
+        # Other rows remain fully editable/removable; defer show_all so the
+        # whole batch gets one layout pass instead of one per row.
         if non_force_actions:
             for action in non_force_actions:
-                self._add_keyword_row(container, rows, action, is_force_row=False)
+                self._add_keyword_row(container, rows, action, is_force_row=False, defer_show=True)
         else:
             # Provide one editable row to start with
-            self._add_keyword_row(container, rows, KeywordAction(word="", keys=[], force_end=False), is_force_row=False)
+            self._add_keyword_row(
+                container, rows, KeywordAction(word="", keys=[], force_end=False), is_force_row=False, defer_show=True
+            )
 
         container.show_all()
 
@@ -519,6 +707,7 @@ class TrayApp:
         rows: list[dict],
         action: KeywordAction | None,
         is_force_row: bool,
+        defer_show: bool = False,
     ):
         row_box = Gtk.Box(spacing=6)
         keyword_entry = Gtk.Entry()
@@ -559,7 +748,8 @@ class TrayApp:
 
         rows.append(row_data)
         container.pack_start(row_box, False, False, 0)
-        container.show_all()
+        if not defer_show:
+            container.show_all()
 
     def _remove_keyword_row(self, container: Gtk.Box, rows: list[dict], row_data: dict):
         if row_data.get("is_force"):
@@ -603,12 +793,7 @@ class TrayApp:
         state = event.state
 
         # Ignore pure modifier presses
-        if keyval in (
-            Gdk.KEY_Control_L, Gdk.KEY_Control_R,
-            Gdk.KEY_Alt_L, Gdk.KEY_Alt_R,
-            Gdk.KEY_Shift_L, Gdk.KEY_Shift_R,
-            Gdk.KEY_Super_L, Gdk.KEY_Super_R,
-        ):
+        if keyval in _MODIFIER_KEYVALS:
             return None
 
         display = Gtk.accelerator_name(keyval, state)
@@ -616,23 +801,15 @@ class TrayApp:
         if not base:
             return None
 
-        mods = []
-        if state & Gdk.ModifierType.CONTROL_MASK:
-            mods.append("ctrl")
-        if state & Gdk.ModifierType.SHIFT_MASK:
-            mods.append("shift")
-        if state & Gdk.ModifierType.MOD1_MASK:
-            mods.append("alt")
-        if state & Gdk.ModifierType.SUPER_MASK:
-            mods.append("super")
-
-        binding_parts = mods + [base]
-        binding = "+".join(binding_parts)
+        mods = [name for mask, name in _MOD_TABLE if state & mask]
+        binding = "+".join(mods + [base])
         return display, binding
 
     def _collect_keyword_actions(self, rows: list[dict]) -> list[KeywordAction]:
-        """Gather keyword actions from UI rows."""
-        actions: list[KeywordAction] = []
+        """Gather keyword actions from UI rows, deduplicated by word."""
+        # Keyed by lowercased word so duplicate rows collapse instead of
+        # registering redundant matchers; the later row wins.
+        seen: dict[str, KeywordAction] = {}
         for row in rows:
             word = row["entry"].get_text().strip()
             if not word:
@@ -640,12 +817,12 @@ class TrayApp:
             binding = row.get("binding") or ""
             keys = [binding] if binding else []
             force_end = row["force_check"].get_active()
-            actions.append(KeywordAction(word=word, keys=keys, force_end=force_end))
+            seen[word.lower()] = KeywordAction(word=word, keys=keys, force_end=force_end)
 
-        if not actions:
+        if not seen:
             # Ensure at least one action exists
-            actions.append(KeywordAction(word="enter", keys=["KP_Enter"], force_end=True))
-        return actions
+            return [KeywordAction(word="enter", keys=["KP_Enter"], force_end=True)]
+        return list(seen.values())
 
     def _apply_settings(
         self,
@@ -659,9 +836,15 @@ class TrayApp:
         # Track changes
         previous_hotkey = self.config.hotkey_toggle_listening
         hotkey_changed = hotkey != previous_hotkey
+        notifications_changed = notifications_enabled != self.config.notifications_enabled
         api_key_state_changed = (api_key != self.config.api_key) or (bool(api_key_validated) != self.config.api_key_validated)
         keywords_changed = keyword_actions != self.config.keyword_actions
 
+        # Save with no edits: skip the disk write, hotkey rebind and
+        # controller cycle entirely.
+        if not (notifications_changed or hotkey_changed or api_key_state_changed or keywords_changed):
+            return
+
         # Update config
         self.config.notifications_enabled = notifications_enabled
         self.config.hotkey_toggle_listening = hotkey
@@ -681,18 +864,31 @@ class TrayApp:
         if hotkey_changed:
             self._update_hotkey(hotkey, previous_hotkey)
 
-        # Apply keyword changes by restarting if currently enabled
-        if keywords_changed and self.controller.enabled:
-            self.controller.set_enabled(False)
-            time.sleep(0.2)
-            self.controller.set_enabled(True)
-
-        # Handle API key changes
-        if api_key_state_changed:
-            self._handle_api_key_change(api_key)
+        # Keyword and API-key changes share one controller cycle, and the
+        # re-enable is scheduled so the GTK loop never blocks on it.
+        needs_restart = keywords_changed
+        restart_msg = None
+        if api_key_state_changed and self._handle_api_key_change(api_key):
+            needs_restart = True
+            restart_msg = "Backend restarted with new API key"
+        if needs_restart:
+            self._restart_controller(500 if restart_msg else 200, restart_msg)
 
         self._notify("Settings saved successfully")
 
+    def _restart_controller(self, delay_ms: int = 200, message: str | None = None):
+        """Cycle the controller without sleeping on the GTK main thread."""
+        if not self.controller.enabled:
+            return
+        self.controller.set_enabled(False)
+        GLib.timeout_add(delay_ms, self._deferred_reenable, message)
+
+    def _deferred_reenable(self, message: str | None):
+        self.controller.set_enabled(True)
+        if message:
+            self._notify(message)
+        return False
+
     def _update_hotkey(self, new_hotkey: str | None, old_hotkey: str | None = None):
         """Update global hotkey binding."""
         # Unbind old hotkey
@@ -724,25 +920,21 @@ class TrayApp:
                 self.sink.info(msg)
                 self._notify(msg, force=True)
 
-    def _handle_api_key_change(self, new_api_key: str | None):
-        """Handle API key change by restarting backend if needed."""
+    def _handle_api_key_change(self, new_api_key: str | None) -> bool:
+        """Warn on a missing key; report whether the backend needs a restart."""
         if not new_api_key and not os.environ.get("SPEECHMATICS_API_KEY"):
             self._notify("Warning: No API key set. Voice typing will not work.", force=True)
-            return
+            return False
         if self.locked:
-            return
-
-        # If currently listening, restart controller to use new key
-        was_enabled = self.controller.enabled
-        if was_enabled:
-            self.controller.set_enabled(False)
-            time.sleep(0.5)
-            self.controller.set_enabled(True)
-            self._notify("Backend restarted with new API key")
+            return False
+        # Only a currently-running controller needs cycling onto the new key.
+        return self.controller.enabled
 
     def _validate_api_key_async(self, api_key: str, on_complete: Callable[[bool], None] | None):
         """Validate key without blocking the GTK loop."""
         def worker():
+            from voicetyper.stt.speechmatics_client import validate_api_key
+
             ok = validate_api_key(
                 api_key=api_key,
                 connection_url=self.config.connection_url,
@@ -752,7 +944,7 @@ class TrayApp:
                 log_fn=self.sink.info,
             )
             if on_complete:
-                GLib.idle_add(lambda: on_complete(ok))
+                self.post_ui(lambda: on_complete(ok))
 
         thread = threading.Thread(target=worker, daemon=True)
         thread.start()
@@ -784,12 +976,37 @@ class TrayApp:
                 Keybinder.unbind(self.config.hotkey_toggle_listening)
             except Exception:
                 pass
-        self.controller.set_enabled(False)
-        Gtk.main_quit()
+        # Controller shutdown can block on websocket close/thread joins;
+        # run it off the main thread so the menu closes instantly, then
+        # quit the loop from back on the UI thread.
+        threading.Thread(target=self._shutdown_and_quit, daemon=True).start()
+
+    def _shutdown_and_quit(self):
+        try:
+            self.controller.set_enabled(False)
+        finally:
+            self.post_ui(Gtk.main_quit)
+
+    def _quit_from_signal(self):
+        self._quit()
+        return GLib.SOURCE_REMOVE
+
+    def _watchdog_refresh(self):
+        # Safety net behind the event-driven refresh: if a state callback is
+        # ever lost, the memoized _refresh_state reconciles within 5 s for
+        # the cost of a tuple compare.
+        self._refresh_state()
+        return True
 
     def run(self):
-        signal.signal(signal.SIGINT, lambda *_args: self._quit())
-        signal.signal(signal.SIGTERM, lambda *_args: self._quit())
+        # GLib-native handlers wake the main loop's poll() immediately;
+        # plain signal.signal handlers only run between Python bytecodes,
+        # which can be seconds away while Gtk.main() sits in C.
+        GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGINT, self._quit_from_signal)
+        GLib.unix_signal_add(GLib.PRIORITY_HIGH, signal.SIGTERM, self._quit_from_signal)
+        # Second-granularity so GLib can coalesce the wakeup with other
+        # timers; the fast path is the controller state callback.
+        GLib.timeout_add_seconds(5, self._watchdog_refresh)
         self._notify(f"Voicetyper ready on {self.device.name}")
         Gtk.main()
 
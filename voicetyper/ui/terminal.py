@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import curses
-import time
+import select
+import sys
 from typing import Callable, List, Optional
 
 from voicetyper.audio.devices import InputDevice
@@ -10,6 +11,10 @@ from voicetyper.audio.devices import InputDevice
 class TerminalUI:
     def __init__(self):
         self.stdscr: Optional[curses.window] = None
+        # Text last drawn per row; draw_status only touches rows whose
+        # content changed, so a steady-state refresh writes nothing.
+        self._row_cache: dict[int, str] = {}
+        self._last_size: tuple[int, int] | None = None
 
     def __enter__(self):
         self.stdscr = curses.initscr()
@@ -49,18 +54,29 @@ class TerminalUI:
         debug_lines: list[str],
     ):
         assert self.stdscr
-        self.stdscr.erase()
         max_rows, max_cols = self.stdscr.getmaxyx()
         max_cols = max(max_cols, 1)
+        if (max_rows, max_cols) != self._last_size:
+            # Resize invalidates every row; full clear, then redraw all.
+            self._last_size = (max_rows, max_cols)
+            self._row_cache.clear()
+            self.stdscr.erase()
+        drawn: set[int] = set()
 
         def safe_add(row: int, text: str):
             if row >= max_rows:
                 return
+            drawn.add(row)
             clipped = text[: max_cols - 1] if max_cols > 1 else ""
+            if self._row_cache.get(row) == clipped:
+                return
             try:
+                self.stdscr.move(row, 0)
+                self.stdscr.clrtoeol()
                 self.stdscr.addstr(row, 0, clipped)
             except curses.error:
                 pass
+            self._row_cache[row] = clipped
 
         safe_add(0, "VoiceTyper")
         safe_add(1, f"Listening enabled: {'YES' if listening_enabled else 'no'}    Streaming: {'YES' if streaming else 'no'}")
@@ -75,17 +91,32 @@ class TerminalUI:
             lines_to_show = debug_lines[-available_rows:] if available_rows > 0 else []
             for i, line in enumerate(lines_to_show):
                 safe_add(start_row + i, line)
+        # Rows drawn last frame but not this one (e.g. a shrinking debug
+        # tail) would otherwise linger; blank them.
+        for row in list(self._row_cache):
+            if row not in drawn:
+                try:
+                    self.stdscr.move(row, 0)
+                    self.stdscr.clrtoeol()
+                except curses.error:
+                    pass
+                del self._row_cache[row]
         self.stdscr.noutrefresh()
         curses.doupdate()
 
     def get_key(self, delay: float = 0.1) -> int | None:
         assert self.stdscr
+        # Sleep in the kernel until a keystroke or the timeout; the
+        # non-blocking getch afterwards then returns immediately.
+        try:
+            ready, _, _ = select.select([sys.stdin], [], [], delay)
+        except (OSError, ValueError):
+            ready = [sys.stdin]
+        if not ready:
+            return None
         self.stdscr.nodelay(True)
         key = self.stdscr.getch()
-        if key == curses.ERR:
-            time.sleep(delay)
-            return None
-        return key
+        return None if key == curses.ERR else key
 
     @staticmethod
     def _meter_bar(level: float, width: int = 10) -> str: